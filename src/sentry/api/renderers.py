@@ -0,0 +1,24 @@
+from typing import Any
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renders JSON with orjson rather than the stdlib encoder DRF uses by default.
+
+    Only suitable for endpoints whose responses are plain JSON types (including
+    subclasses such as ErrorDetail), as DRF's encoder fallbacks for lazy strings,
+    decimals, querysets etc. are not available.
+    """
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict[str, Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
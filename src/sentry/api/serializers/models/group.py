@@ -999,36 +999,21 @@ class GroupSerializerSnuba(GroupSerializerBase):
         project_ids=None,
     ):
         super().__init__(collapse=collapse, expand=expand)
-        from sentry.search.snuba.executors import get_search_filter
+        from sentry.search.snuba.executors import get_search_filter_date_bounds
 
         self.environment_ids = environment_ids
         self.organization_id = organization_id
         # XXX: We copy this logic from `PostgresSnubaQueryExecutor.query`. Ideally we
         # should try and encapsulate this logic, but if you're changing this, change it
         # there as well.
+        filter_start, filter_end = get_search_filter_date_bounds(search_filters)
         self.start = None
-        start_params = [
-            _f
-            for _f in [
-                start,
-                get_search_filter(search_filters, "date", ">"),
-                get_search_filter(search_filters, "timestamp", ">"),
-            ]
-            if _f
-        ]
+        start_params = [_f for _f in [start, filter_start] if _f]
         if start_params:
             self.start = max(_f for _f in start_params if _f)
 
         self.end = None
-        end_params = [
-            _f
-            for _f in [
-                end,
-                get_search_filter(search_filters, "date", "<"),
-                get_search_filter(search_filters, "timestamp", "<"),
-            ]
-            if _f
-        ]
+        end_params = [_f for _f in [end, filter_end] if _f]
         if end_params:
             self.end = min(end_params)
 
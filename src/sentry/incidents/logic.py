@@ -1271,7 +1271,7 @@ def _prioritize_actions(
     sorted_actions = sorted(
         actions,
         key=lambda action: triggers_dict.get(
-            action.alert_rule_trigger.id, len(actions) + action.id
+            action.alert_rule_trigger_id, len(actions) + action.id
         ),
     )
     return sorted_actions
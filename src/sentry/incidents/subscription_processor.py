@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import logging
 import math
+import random
+from contextlib import nullcontext
 from datetime import datetime, timedelta
+from functools import cache
 from typing import Literal, TypedDict, TypeVar
 
 from django.conf import settings
@@ -35,6 +38,7 @@ from sentry.workflow_engine.processors.data_packet import process_data_packet
 from sentry.workflow_engine.types import DetectorGroupKey
 
 logger = logging.getLogger(__name__)
+compare_and_set_last_update = redis.load_redis_script("alerts/compare_and_set_last_update.lua")
 REDIS_TTL = int(timedelta(days=7).total_seconds())
 # Stores a minimum threshold that represents a session count under which we don't evaluate crash
 # rate alert, and the update is just dropped. If it is set to None, then no minimum threshold
@@ -42,9 +46,14 @@ REDIS_TTL = int(timedelta(days=7).total_seconds())
 # ToDo(ahmed): This is still experimental. If we decide that it makes sense to keep this
 #  functionality, then maybe we should move this to constants
 CRASH_RATE_ALERT_MINIMUM_THRESHOLD: int | None = None
+PROCESS_UPDATE_MEMORY_SAMPLE_RATE = 0.01
 
 T = TypeVar("T")
 
+# Resolve the parametrized DataPacket aliases once instead of on every update.
+MetricDataPacket = DataPacket[ProcessedSubscriptionUpdate]
+AnomalyDetectionDataPacket = DataPacket[AnomalyDetectionUpdate]
+
 
 class MetricIssueDetectorConfig(TypedDict):
     """
@@ -61,6 +70,8 @@ class SubscriptionProcessor:
     Use the `process` classmethod as the entry point.
     """
 
+    __slots__ = ("subscription", "detector", "last_update")
+
     def __init__(
         self,
         subscription: QuerySubscription,
@@ -72,7 +83,8 @@ class SubscriptionProcessor:
         """
         self.subscription = subscription
         self.detector = detector
-        self.last_update = get_detector_last_update(detector, subscription.project_id)
+        # Set to the update's timestamp once `process_update` has accepted it.
+        self.last_update = to_datetime(0)
 
     @classmethod
     def process(
@@ -149,15 +161,16 @@ class SubscriptionProcessor:
     def get_aggregation_value(
         self, subscription_update: QuerySubscriptionUpdate, comparison_delta: int | None = None
     ) -> float | None:
-        if self.subscription.snuba_query.dataset == Dataset.Metrics.value:
+        snuba_query = self.subscription.snuba_query
+        if snuba_query.dataset == Dataset.Metrics.value:
             aggregation_value = self.get_crash_rate_alert_metrics_aggregation_value(
                 subscription_update
             )
         else:
             aggregation_value = get_comparison_aggregation_value(
                 subscription_update=subscription_update,
-                snuba_query=self.subscription.snuba_query,
-                organization_id=self.subscription.project.organization.id,
+                snuba_query=snuba_query,
+                organization_id=self.subscription.project.organization_id,
                 project_ids=[self.subscription.project_id],
                 comparison_delta=comparison_delta,
                 alert_rule_id=None,
@@ -188,7 +201,7 @@ class SubscriptionProcessor:
                 },
                 timestamp=self.last_update,
             )
-            anomaly_detection_data_packet = DataPacket[AnomalyDetectionUpdate](
+            anomaly_detection_data_packet = AnomalyDetectionDataPacket(
                 source_id=str(self.subscription.id), packet=anomaly_detection_packet
             )
             results = process_data_packet(
@@ -201,7 +214,7 @@ class SubscriptionProcessor:
                 values={"value": aggregation_value},
                 timestamp=self.last_update,
             )
-            metric_data_packet = DataPacket[ProcessedSubscriptionUpdate](
+            metric_data_packet = MetricDataPacket(
                 source_id=str(self.subscription.id), packet=metric_packet
             )
             results = process_data_packet(metric_data_packet, DATA_SOURCE_SNUBA_QUERY_SUBSCRIPTION)
@@ -213,6 +226,16 @@ class SubscriptionProcessor:
         Core processing method. Assumes subscription has cached project/organization
         and detector exists (enforced by the `process` classmethod).
         """
+        # Cheap read-only check so replayed or duplicate updates are dropped before doing any
+        # other work. The update is only recorded as processed once processing succeeds.
+        if subscription_update["timestamp"] <= get_detector_last_update(
+            self.detector, self.subscription.project_id
+        ):
+            metrics.incr("incidents.alert_rules.skipping_already_processed_update")
+            return False
+
+        self.last_update = subscription_update["timestamp"]
+
         dataset = self.subscription.snuba_query.dataset
         organization = self.subscription.project.organization
 
@@ -230,30 +253,24 @@ class SubscriptionProcessor:
                 tags={"dataset": dataset},
             )
 
-        if subscription_update["timestamp"] <= self.last_update:
-            metrics.incr("incidents.alert_rules.skipping_already_processed_update")
-            return False
-
-        self.last_update = subscription_update["timestamp"]
-
-        if (
-            len(subscription_update["values"]["data"]) > 1
-            and self.subscription.snuba_query.dataset != Dataset.Metrics.value
-        ):
+        if len(subscription_update["values"]["data"]) > 1 and dataset != Dataset.Metrics.value:
             logger.warning(
                 "Subscription returned more than 1 row of data",
                 extra={
                     "subscription_id": self.subscription.id,
-                    "dataset": self.subscription.snuba_query.dataset,
+                    "dataset": dataset,
                     "snuba_subscription_id": self.subscription.subscription_id,
                     "result": subscription_update,
                 },
             )
 
-        with (
-            metrics.timer("incidents.alert_rules.process_update"),
-            track_memory_usage("incidents.alert_rules.process_update_memory"),
-        ):
+        # Measuring RSS costs two getrusage syscalls, so only sample a fraction of updates.
+        memory_tracker = (
+            track_memory_usage("incidents.alert_rules.process_update_memory")
+            if random.random() < PROCESS_UPDATE_MEMORY_SAMPLE_RATE
+            else nullcontext()
+        )
+        with metrics.timer("incidents.alert_rules.process_update"), memory_tracker:
             metrics.incr("incidents.alert_rules.process_update.start")
             comparison_delta = self.get_comparison_delta(self.detector)
             aggregation_value = self.get_aggregation_value(subscription_update, comparison_delta)
@@ -262,17 +279,18 @@ class SubscriptionProcessor:
                 metrics.incr("incidents.alert_rules.skipping_update_invalid_aggregation_value")
                 # We have an invalid aggregate, but we _did_ process the update, so we store
                 # last_update to reflect that and avoid reprocessing.
-                store_detector_last_update(
-                    self.detector, self.subscription.project.id, self.last_update
+                compare_and_store_detector_last_update(
+                    self.detector, self.subscription.project_id, self.last_update
                 )
                 return False
 
             self.process_results_workflow_engine(
                 self.detector, subscription_update, aggregation_value
             )
-            # Ensure that we have last_update stored for all Detector evaluations.
-            store_detector_last_update(
-                self.detector, self.subscription.project.id, self.last_update
+            # Ensure that we have last_update stored for all Detector evaluations. The
+            # compare-and-set keeps a slower consumer from moving it backwards.
+            compare_and_store_detector_last_update(
+                self.detector, self.subscription.project_id, self.last_update
             )
             return True
 
@@ -295,6 +313,23 @@ def store_detector_last_update(detector: Detector, project_id: int, last_update:
     )
 
 
+def compare_and_store_detector_last_update(
+    detector: Detector, project_id: int, last_update: datetime
+) -> bool:
+    """
+    Stores `last_update` only if it is newer than the currently stored value. Returns False
+    if an update with the same or a later timestamp has already been stored.
+    """
+    return bool(
+        compare_and_set_last_update(
+            [build_detector_last_update_key(detector, project_id)],
+            [int(last_update.timestamp()), REDIS_TTL],
+            client=get_redis_client(),
+        )
+    )
+
+
+@cache
 def get_redis_client() -> RetryingRedisCluster:
     cluster_key = settings.SENTRY_INCIDENT_RULES_REDIS_CLUSTER
     return redis.redis_clusters.get(cluster_key)  # type: ignore[return-value]
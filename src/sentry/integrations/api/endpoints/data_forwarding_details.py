@@ -1,6 +1,7 @@
 from typing import Any
 
 from django.db import router, transaction
+from django.db.models import Exists, OuterRef, Q
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import never_cache
 from drf_spectacular.utils import extend_schema
@@ -139,23 +140,27 @@ class DataForwardingDetailsEndpoint(OrganizationEndpoint):
             Tuple of (project_ids_to_enroll, project_ids_to_unenroll)
         """
         project_ids_new: set[int] = set(request.data.get("project_ids", []))
-        project_ids_current: set[int] = set(
-            DataForwarderProject.objects.filter(
-                data_forwarder=data_forwarder, is_enabled=True
-            ).values_list("project_id", flat=True)
+        enrolled_projects = DataForwarderProject.objects.filter(
+            data_forwarder=data_forwarder, is_enabled=True
+        )
+
+        # Fetch the requested projects together with the currently enrolled ones, flagging
+        # which of them are enrolled, so a single query covers both. Only the fields read by
+        # the project access checks below are loaded.
+        projects = list(
+            Project.objects.filter(
+                Q(id__in=project_ids_new) | Q(id__in=enrolled_projects.values("project_id")),
+                organization_id=organization.id,
+            )
+            .only("id", "organization_id", "status")
+            .annotate(is_enrolled=Exists(enrolled_projects.filter(project_id=OuterRef("id"))))
         )
+        all_projects_by_id: dict[int, Project] = {project.id: project for project in projects}
+        project_ids_current: set[int] = {project.id for project in projects if project.is_enrolled}
 
         project_ids_to_enroll: set[int] = project_ids_new - project_ids_current
         project_ids_to_unenroll: set[int] = project_ids_current - project_ids_new
 
-        all_project_ids: set[int] = project_ids_new | project_ids_to_unenroll
-        all_projects_by_id: dict[int, Project] = {
-            project.id: project
-            for project in Project.objects.filter(
-                organization_id=organization.id, id__in=all_project_ids
-            )
-        }
-
         # Validate new project IDs being enrolled exist in the organization
         missing_ids: set[int] = project_ids_to_enroll - all_projects_by_id.keys()
         if missing_ids:
@@ -202,16 +207,16 @@ class DataForwardingDetailsEndpoint(OrganizationEndpoint):
             request, organization, data_forwarder
         )
 
-        with transaction.atomic(router.db_for_write(DataForwarderProject)):
-            existing_data_forwarder_projects: set[int] = set(
-                DataForwarderProject.objects.filter(
-                    data_forwarder=data_forwarder, project_id__in=project_ids_to_enroll
-                ).values_list("project_id", flat=True)
+        # Nothing to change, so skip opening a write transaction entirely.
+        if not project_ids_to_enroll and not project_ids_to_unenroll:
+            return Response(
+                serialize(data_forwarder, request.user, access=request.access),
+                status=status.HTTP_200_OK,
             )
 
-            new_data_forwarder_projects: set[int] = (
-                project_ids_to_enroll - existing_data_forwarder_projects
-            )
+        with transaction.atomic(router.db_for_write(DataForwarderProject)):
+            # Re-enables previously unenrolled projects in the same statement, keeping any
+            # existing overrides.
             DataForwarderProject.objects.bulk_create(
                 [
                     DataForwarderProject(
@@ -219,14 +224,13 @@ class DataForwardingDetailsEndpoint(OrganizationEndpoint):
                         project_id=project_id,
                         is_enabled=True,
                     )
-                    for project_id in new_data_forwarder_projects
-                ]
+                    for project_id in project_ids_to_enroll
+                ],
+                update_conflicts=True,
+                unique_fields=["data_forwarder", "project"],
+                update_fields=["is_enabled", "date_updated"],
             )
 
-            DataForwarderProject.objects.filter(
-                data_forwarder=data_forwarder, project_id__in=existing_data_forwarder_projects
-            ).update(is_enabled=True)
-
             DataForwarderProject.objects.filter(
                 data_forwarder=data_forwarder, project_id__in=project_ids_to_unenroll
             ).update(is_enabled=False)
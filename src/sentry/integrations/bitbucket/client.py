@@ -6,7 +6,10 @@ from typing import Any
 from urllib.parse import parse_qs, urlparse, urlsplit
 
 from requests import PreparedRequest
+from requests.adapters import Retry
+from urllib3.response import BaseHTTPResponse
 
+from sentry.http import build_session
 from sentry.integrations.client import ApiClient
 from sentry.integrations.models.integration import Integration
 from sentry.integrations.services.integration.model import RpcIntegration
@@ -14,6 +17,8 @@ from sentry.integrations.source_code_management.repository import RepositoryClie
 from sentry.integrations.types import IntegrationProviderSlug
 from sentry.integrations.utils.atlassian_connect import get_query_hash
 from sentry.models.repository import Repository
+from sentry.net.http import SafeSession
+from sentry.shared_integrations.response.base import BaseApiResponse
 from sentry.utils import jwt
 from sentry.utils.http import absolute_uri
 from sentry.utils.patch_set import patch_to_file_changes
@@ -22,6 +27,18 @@ BITBUCKET_KEY = f"{urlparse(absolute_uri()).hostname}.bitbucket"
 
 logger = logging.getLogger(__name__)
 
+# Requests run on web workers over a shared session, so never sleep for as long as
+# Bitbucket asks; anything longer is surfaced to the caller as a rate limit instead.
+MAX_RETRY_AFTER_SECONDS = 2
+
+
+class _CappedRetry(Retry):
+    def get_retry_after(self, response: BaseHTTPResponse) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER_SECONDS)
+
 
 class BitbucketAPIPath:
     """
@@ -59,6 +76,7 @@ class BitbucketApiClient(ApiClient, RepositoryClient):
     # Bitbucket Cloud defaults to pagelen=10 and caps at 100.
     page_size = 100
     page_number_limit = 50
+    reuse_session = True
 
     def __init__(self, integration: RpcIntegration | Integration):
         self.base_url = integration.metadata["base_url"]
@@ -91,16 +109,41 @@ class BitbucketApiClient(ApiClient, RepositoryClient):
         prepared_request.headers["Authorization"] = f"JWT {encoded_jwt}"
         return prepared_request
 
+    def build_session(self) -> SafeSession:
+        """
+        Bitbucket rate limits aggressively (e.g. issue search, which backs autocomplete), so
+        retry idempotent requests on 429s and transient 5xxs, honoring Retry-After up to
+        MAX_RETRY_AFTER_SECONDS. Writes are never retried, as Bitbucket has no idempotency keys to deduplicate them.
+        """
+        return build_session(
+            max_retries=_CappedRetry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=["HEAD", "GET"],
+                respect_retry_after_header=True,
+                # Hand the final response back so it surfaces as a regular ApiError.
+                raise_on_status=False,
+            )
+        )
+
     def get_issue(self, repo, issue_id):
         return self.get(BitbucketAPIPath.issue.format(repo=repo, issue_id=issue_id))
 
     def create_issue(self, repo, data):
         return self.post(path=BitbucketAPIPath.issues.format(repo=repo), data=data)
 
-    def search_issues(self, repo: str, query: str) -> dict[str, Any]:
+    def search_issues(self, repo: str, query: str, etag: str | None = None) -> BaseApiResponse:
         # Query filters can be found here:
         # https://developer.atlassian.com/bitbucket/api/2/reference/meta/filtering#supp-endpoints
-        return self.get(path=BitbucketAPIPath.issues.format(repo=repo), params={"q": query})
+        # When an ETag is given and the results are unchanged, Bitbucket answers with an
+        # empty 304 which comes back as a TextApiResponse.
+        return self.get(
+            path=BitbucketAPIPath.issues.format(repo=repo),
+            params={"q": query},
+            headers={"If-None-Match": etag} if etag else None,
+            allow_text=True,
+        )
 
     def create_comment(self, repo, issue_id, data):
         # Call the method as below:
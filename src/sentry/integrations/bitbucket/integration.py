@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import cached_property
 from itertools import chain
 from typing import Any
 
@@ -110,9 +111,15 @@ class BitbucketIntegration(RepositoryIntegration[BitbucketApiClient], BitbucketI
     def integration_name(self) -> str:
         return IntegrationProviderSlug.BITBUCKET.value
 
-    def get_client(self) -> BitbucketApiClient:
+    @cached_property
+    def _client(self) -> BitbucketApiClient:
+        # The client only carries the integration's static credentials, so a single
+        # instance can serve every call made through this installation.
         return BitbucketApiClient(integration=self.model)
 
+    def get_client(self) -> BitbucketApiClient:
+        return self._client
+
     # IntegrationInstallation methods
 
     def error_message_from_json(self, data):
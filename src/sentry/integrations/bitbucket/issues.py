@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from time import time
 from typing import Any, NoReturn
 
-from django.urls import reverse
+from django.core.cache import cache
 
 from sentry.integrations.source_code_management.issues import SourceCodeIssueIntegration
 from sentry.models.group import Group
@@ -17,12 +18,17 @@ from sentry.silo.base import all_silo_function
 from sentry.users.models.identity import Identity
 from sentry.users.models.user import User
 from sentry.users.services.user import RpcUser
-from sentry.utils.strings import truncatechars
+from sentry.utils.hashlib import md5_text
 
 # Generated based on the response from the Bitbucket API
 # Example: {"type": "error", "error": {"message": "Repository has no issue tracker."}}
-BITBUCKET_HALT_ERROR_CODES = ["Repository has no issue tracker.", "Resource not found"]
+BITBUCKET_NO_ISSUE_TRACKER_ERROR = "Repository has no issue tracker."
+BITBUCKET_RESOURCE_NOT_FOUND_ERROR = "Resource not found"
+BITBUCKET_HALT_ERROR_CODES = [BITBUCKET_NO_ISSUE_TRACKER_ERROR, BITBUCKET_RESOURCE_NOT_FOUND_ERROR]
 BITBUCKET_MAX_TITLE_LENGTH = 255
+# Issue search backs autocomplete, which fires on every keystroke.
+SEARCH_ISSUES_CACHE_TTL = 30
+SEARCH_ISSUES_ETAG_TTL = 15 * 60
 
 
 ISSUE_TYPES = (
@@ -40,10 +46,28 @@ PRIORITIES = (
     ("blocker", "Blocker"),
 )
 
+# These fields never vary between installations, so build them once rather than on
+# every render of the create issue form. Treat them as read-only.
+ISSUE_TYPE_FIELD = {
+    "name": "issue_type",
+    "label": "Issue type",
+    "default": ISSUE_TYPES[0][0],
+    "type": "select",
+    "choices": ISSUE_TYPES,
+}
+
+PRIORITY_FIELD = {
+    "name": "priority",
+    "label": "Priority",
+    "default": PRIORITIES[0][0],
+    "type": "select",
+    "choices": PRIORITIES,
+}
+
 
 class BitbucketIssuesSpec(SourceCodeIssueIntegration):
     def get_issue_url(self, key: str) -> str:
-        repo, issue_id = key.split("#")
+        repo, issue_id = key.split("#", 1)
         return f"https://bitbucket.org/{repo}/issues/{issue_id}"
 
     def get_persisted_default_config_fields(self) -> Sequence[str]:
@@ -70,16 +94,13 @@ class BitbucketIssuesSpec(SourceCodeIssueIntegration):
         params = kwargs.pop("params", {})
         default_repo, repo_choices = self.get_repository_choices(group, params)
 
-        autocomplete_url = reverse(
-            "sentry-extensions-bitbucket-search", args=[org.slug, self.model.id]
-        )
+        autocomplete_url = self.get_search_url("sentry-extensions-bitbucket-search", org.slug)
 
         title_field = next((field for field in fields if field["name"] == "title"), None)
         if title_field:
             title_field["maxLength"] = BITBUCKET_MAX_TITLE_LENGTH
-            title_field["default"] = truncatechars(
-                title_field["default"], BITBUCKET_MAX_TITLE_LENGTH
-            )
+            if len(title := title_field["default"]) > BITBUCKET_MAX_TITLE_LENGTH:
+                title_field["default"] = title[: BITBUCKET_MAX_TITLE_LENGTH - 3] + "..."
 
         return [
             {
@@ -93,20 +114,8 @@ class BitbucketIssuesSpec(SourceCodeIssueIntegration):
                 "label": "Bitbucket Repository",
             },
             *fields,
-            {
-                "name": "issue_type",
-                "label": "Issue type",
-                "default": ISSUE_TYPES[0][0],
-                "type": "select",
-                "choices": ISSUE_TYPES,
-            },
-            {
-                "name": "priority",
-                "label": "Priority",
-                "default": PRIORITIES[0][0],
-                "type": "select",
-                "choices": PRIORITIES,
-            },
+            ISSUE_TYPE_FIELD,
+            PRIORITY_FIELD,
         ]
 
     def get_link_issue_config(self, group: Group, **kwargs) -> list[dict[str, Any]]:
@@ -114,9 +123,7 @@ class BitbucketIssuesSpec(SourceCodeIssueIntegration):
         default_repo, repo_choices = self.get_repository_choices(group, params)
 
         org = group.organization
-        autocomplete_url = reverse(
-            "sentry-extensions-bitbucket-search", args=[org.slug, self.model.id]
-        )
+        autocomplete_url = self.get_search_url("sentry-extensions-bitbucket-search", org.slug)
 
         return [
             {
@@ -191,7 +198,7 @@ class BitbucketIssuesSpec(SourceCodeIssueIntegration):
         data = kwargs["data"]
         client = self.get_client()
 
-        repo, issue_num = external_issue.key.split("#")
+        repo, issue_num = external_issue.key.split("#", 1)
 
         if not repo:
             raise IntegrationFormError({"repo": "Repository is required"})
@@ -208,8 +215,26 @@ class BitbucketIssuesSpec(SourceCodeIssueIntegration):
                 self.raise_error(e)
 
     def search_issues(self, query: str | None, **kwargs) -> dict[str, Any]:
-        client = self.get_client()
         repo = kwargs["repo"]
-        resp = client.search_issues(repo, query)
-        assert isinstance(resp, dict)
-        return resp
+        key = f"bitbucket:search_issues:{self.model.id}:{md5_text(f'{repo}#{query}').hexdigest()}"
+        cached = cache.get(key)
+        if cached is not None and time() - cached["fetched_at"] < SEARCH_ISSUES_CACHE_TTL:
+            return cached["results"]
+
+        etag = cached["etag"] if cached is not None else None
+        resp = self.get_client().search_issues(repo, query, etag=etag)
+        if cached is not None and resp.status_code == 304:
+            results = cached["results"]
+        else:
+            assert isinstance(resp, dict)
+            results = dict(resp)
+            etag = (resp.headers or {}).get("ETag")
+
+        # With an ETag, keep the results past the freshness window so that later searches
+        # can revalidate them with a conditional request instead of a full download.
+        cache.set(
+            key,
+            {"etag": etag, "results": results, "fetched_at": time()},
+            SEARCH_ISSUES_ETAG_TTL if etag else SEARCH_ISSUES_CACHE_TTL,
+        )
+        return results
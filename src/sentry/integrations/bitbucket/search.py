@@ -1,4 +1,5 @@
 import logging
+from operator import itemgetter
 from typing import TypeVar
 
 from rest_framework.response import Response
@@ -6,7 +7,12 @@ from rest_framework.response import Response
 from sentry.api.api_owners import ApiOwner
 from sentry.api.api_publish_status import ApiPublishStatus
 from sentry.api.base import control_silo_endpoint
+from sentry.api.renderers import ORJSONRenderer
 from sentry.integrations.bitbucket.integration import BitbucketIntegration
+from sentry.integrations.bitbucket.issues import (
+    BITBUCKET_NO_ISSUE_TRACKER_ERROR,
+    BITBUCKET_RESOURCE_NOT_FOUND_ERROR,
+)
 from sentry.integrations.models.integration import Integration
 from sentry.integrations.source_code_management.issues import SourceCodeIssueIntegration
 from sentry.integrations.source_code_management.metrics import (
@@ -15,12 +21,25 @@ from sentry.integrations.source_code_management.metrics import (
 )
 from sentry.integrations.source_code_management.search import SourceCodeSearchEndpoint
 from sentry.integrations.types import IntegrationProviderSlug
-from sentry.shared_integrations.exceptions import ApiError
+from sentry.shared_integrations.exceptions import ApiError, ApiRateLimitedError
 
 logger = logging.getLogger("sentry.integrations.bitbucket")
 
 T = TypeVar("T", bound=SourceCodeIssueIntegration)
 
+_issue_id_and_title = itemgetter("id", "title")
+
+
+def _get_error_message(error: ApiError) -> str | None:
+    # Error bodies are not guaranteed to be shaped like {"error": {"message": ...}}.
+    body = error.json
+    if not isinstance(body, dict):
+        return None
+    details = body.get("error")
+    if not isinstance(details, dict):
+        return None
+    return details.get("message")
+
 
 @control_silo_endpoint
 class BitbucketSearchEndpoint(SourceCodeSearchEndpoint):
@@ -28,6 +47,7 @@ class BitbucketSearchEndpoint(SourceCodeSearchEndpoint):
     publish_status = {
         "GET": ApiPublishStatus.PRIVATE,
     }
+    renderer_classes = (ORJSONRenderer,)
 
     @property
     def repository_field(self) -> str:
@@ -52,13 +72,17 @@ class BitbucketSearchEndpoint(SourceCodeSearchEndpoint):
             full_query = f'title~"{query}"'
             try:
                 response = installation.search_issues(query=full_query, repo=repo)
+            except ApiRateLimitedError:
+                lifecycle.record_halt(str(SourceCodeSearchEndpointHaltReason.RATE_LIMITED))
+                return Response({"detail": "Bitbucket rate limit exceeded."}, status=429)
             except ApiError as e:
-                if "no issue tracker" in str(e):
+                error_message = _get_error_message(e)
+                if error_message == BITBUCKET_NO_ISSUE_TRACKER_ERROR:
                     lifecycle.record_halt(str(SourceCodeSearchEndpointHaltReason.NO_ISSUE_TRACKER))
                     return Response(
                         {"detail": "Bitbucket Repository has no issue tracker."}, status=400
                     )
-                elif "resource not found" in str(e):
+                elif error_message == BITBUCKET_RESOURCE_NOT_FOUND_ERROR:
                     lifecycle.record_halt(
                         str(SourceCodeSearchEndpointHaltReason.MISSING_REPOSITORY_OR_NO_ACCESS)
                     )
@@ -68,8 +92,8 @@ class BitbucketSearchEndpoint(SourceCodeSearchEndpoint):
             assert isinstance(response, dict)
             return Response(
                 [
-                    {"label": "#{} {}".format(i["id"], i["title"]), "value": i["id"]}
-                    for i in response.get("values", [])
+                    {"label": f"#{issue_id} {title}", "value": issue_id}
+                    for issue_id, title in map(_issue_id_and_title, response.get("values", ()))
                 ]
             )
 
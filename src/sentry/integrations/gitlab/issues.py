@@ -1,11 +1,8 @@
 from __future__ import annotations
 
-import re
 from collections.abc import Mapping, Sequence
 from typing import Any
 
-from django.urls import reverse
-
 from sentry.integrations.source_code_management.issues import SourceCodeIssueIntegration
 from sentry.models.group import Group
 from sentry.shared_integrations.exceptions import (
@@ -19,8 +16,6 @@ from sentry.users.models.user import User
 from sentry.users.services.user import RpcUser
 from sentry.utils.http import absolute_uri
 
-ISSUE_EXTERNAL_KEY_FORMAT = re.compile(r".+:(.+)#(.+)")
-
 GITLAB_ISSUE_TITLE_MAX_LENGTH = 255
 
 
@@ -29,9 +24,9 @@ class GitlabIssuesSpec(SourceCodeIssueIntegration):
         return "{}:{}".format(self.model.metadata["domain_name"], data["key"])
 
     def get_issue_url(self, key: str) -> str:
-        match = ISSUE_EXTERNAL_KEY_FORMAT.match(key)
-        assert match is not None
-        project, issue_id = match.group(1), match.group(2)
+        # Keys look like "{domain_name}:{project path}#{issue iid}".
+        _, project_and_issue_id = key.rsplit(":", 1)
+        project, issue_id = project_and_issue_id.rsplit("#", 1)
         return "{}/{}/issues/{}".format(self.model.metadata["base_url"], project, issue_id)
 
     def get_persisted_default_config_fields(self) -> Sequence[str]:
@@ -45,12 +40,11 @@ class GitlabIssuesSpec(SourceCodeIssueIntegration):
 
         # XXX: In GitLab repositories are called projects but get_repository_choices
         # expects the param to be called 'repo', so we need to rename it here.
-        # Django QueryDicts are immutable, so we need to copy it first.
-        params_mut = dict(params)
+        # Django QueryDicts are immutable, so build a new mapping with the override.
         repo = params.get("project") or defaults.get("project")
-        params_mut["repo"] = str(repo) if repo is not None else None
+        params_with_repo = {**params, "repo": str(repo) if repo is not None else None}
 
-        default_project, project_choices = self.get_repository_choices(group, params_mut)
+        default_project, project_choices = self.get_repository_choices(group, params_with_repo)
         return default_project, project_choices
 
     def create_default_repo_choice(self, default_repo):
@@ -72,9 +66,7 @@ class GitlabIssuesSpec(SourceCodeIssueIntegration):
         default_project, project_choices = self.get_projects_and_default(group, params, **kwargs)
 
         org = self.organization
-        autocomplete_url = reverse(
-            "sentry-extensions-gitlab-search", args=[org.slug, self.model.id]
-        )
+        autocomplete_url = self.get_search_url("sentry-extensions-gitlab-search", org.slug)
 
         return [
             {
@@ -89,6 +81,16 @@ class GitlabIssuesSpec(SourceCodeIssueIntegration):
             *fields,
         ]
 
+    def _get_project_and_issue_iid(self, client, project_id, issue) -> str:
+        # Issues carry their full "namespace/project#iid" reference, which saves
+        # fetching the project just for its path.
+        if full_reference := issue.get("references", {}).get("full"):
+            return full_reference
+
+        # Fetch the project uncached, as its path changes when it is renamed or moved.
+        project = client.get_project(project_id)
+        return "{}#{}".format(project["path_with_namespace"], issue["iid"])
+
     def create_issue(self, data, **kwargs):
         client = self.get_client()
 
@@ -108,11 +110,10 @@ class GitlabIssuesSpec(SourceCodeIssueIntegration):
                 project=project_id,
                 data={"title": title, "description": data["description"]},
             )
-            project = client.get_project(project_id)
+            project_and_issue_iid = self._get_project_and_issue_iid(client, project_id, issue)
         except ApiError as e:
             raise IntegrationError(self.message_from_error(e))
 
-        project_and_issue_iid = "{}#{}".format(project["path_with_namespace"], issue["iid"])
         return {
             "key": project_and_issue_iid,
             "title": title,
@@ -124,7 +125,7 @@ class GitlabIssuesSpec(SourceCodeIssueIntegration):
 
     def after_link_issue(self, external_issue, **kwargs):
         data = kwargs["data"]
-        project_id, issue_id = data.get("externalIssue", "").split("#")
+        project_id, issue_id = data.get("externalIssue", "").split("#", 1)
         if not (project_id and issue_id):
             raise IntegrationError("Project and Issue id must be provided")
 
@@ -144,9 +145,7 @@ class GitlabIssuesSpec(SourceCodeIssueIntegration):
         default_project, project_choices = self.get_projects_and_default(group, params, **kwargs)
 
         org = group.organization
-        autocomplete_url = reverse(
-            "sentry-extensions-gitlab-search", args=[org.slug, self.model.id]
-        )
+        autocomplete_url = self.get_search_url("sentry-extensions-gitlab-search", org.slug)
 
         return [
             {
@@ -183,7 +182,7 @@ class GitlabIssuesSpec(SourceCodeIssueIntegration):
         ]
 
     def get_issue(self, issue_id, **kwargs):
-        project_id, issue_num = issue_id.split("#")
+        project_id, issue_num = issue_id.split("#", 1)
         client = self.get_client()
 
         if not project_id:
@@ -194,11 +193,10 @@ class GitlabIssuesSpec(SourceCodeIssueIntegration):
 
         try:
             issue = client.get_issue(project_id, issue_num)
-            project = client.get_project(project_id)
+            project_and_issue_iid = self._get_project_and_issue_iid(client, project_id, issue)
         except ApiError as e:
             raise IntegrationError(self.message_from_error(e))
 
-        project_and_issue_iid = "{}#{}".format(project["path_with_namespace"], issue["iid"])
         return {
             "key": project_and_issue_iid,
             "title": issue["title"],
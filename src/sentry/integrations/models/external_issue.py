@@ -57,6 +57,23 @@ class ExternalIssueManager(BaseManager["ExternalIssue"]):
     def has_linked_issue(self, event: GroupEvent, integration: RpcIntegration) -> bool:
         return self.get_linked_issues(event, integration).exists()
 
+    def get_linked_integration_ids(self, event: GroupEvent) -> set[int]:
+        """
+        Return the ids of every integration that already has an issue linked to the event's group.
+        """
+        from sentry.models.grouplink import GroupLink
+
+        assert event.group is not None
+        return set(
+            self.filter(
+                id__in=GroupLink.objects.filter(
+                    project_id=event.group.project_id,
+                    group_id=event.group.id,
+                    linked_type=GroupLink.LinkedType.issue,
+                ).values_list("linked_id", flat=True),
+            ).values_list("integration_id", flat=True)
+        )
+
 
 @cell_silo_model
 class ExternalIssue(Model):
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import time
 from abc import ABC
-from typing import TypedDict
+from collections.abc import Iterator
+from typing import Any, TypedDict
 from urllib.parse import urlencode
 
+from django.core.cache import cache
 from requests import PreparedRequest
 
 from sentry import options
@@ -13,13 +15,21 @@ from sentry.integrations.models import Integration
 from sentry.integrations.services.integration import integration_service
 from sentry.integrations.services.integration.model import RpcIntegration
 from sentry.integrations.types import IntegrationProviderSlug
+from sentry.locks import locks
 from sentry.shared_integrations.client.proxy import IntegrationProxyClient, infer_org_integration
 from sentry.shared_integrations.exceptions import IntegrationError
 from sentry.silo.base import SiloMode, control_silo_function
+from sentry.utils.locking import UnableToAcquireLock
 
 # five minutes which is industry standard clock skew tolerance
 CLOCK_SKEW = 60 * 5
 
+# Bot tokens are shared by every client for an integration, so the most recent refresh
+# is cached across processes and refreshes are serialized behind a lock. This keeps
+# concurrent workers from each exchanging a new token.
+TOKEN_REFRESH_LOCK_DURATION = 30
+TOKEN_REFRESH_LOCK_TIMEOUT = 10
+
 
 # MsTeamsClientABC abstract client does not handle setting the base url or auth token
 class MsTeamsClientABC(ApiClient, ABC):
@@ -42,6 +52,20 @@ class MsTeamsClientABC(ApiClient, ABC):
             params["continuationToken"] = continuation_token
         return self.get(url, params=params)
 
+    def iter_members(self, team_id: str, max_pages: int) -> Iterator[dict[str, Any]]:
+        """
+        Yield the members of a team, following continuation tokens for at most `max_pages` pages.
+        """
+        url = self.MEMBER_URL % team_id
+        params: dict[str, int | str] = {"pageSize": 500}
+        for _ in range(max_pages):
+            resp = self.get(url, params=params)
+            yield from resp.get("members") or ()
+            continuation_token = resp.get("continuationToken")
+            if not continuation_token:
+                return
+            params["continuationToken"] = continuation_token
+
     def get_user_conversation_id(self, user_id: str, tenant_id: str):
         data = {"members": [{"id": user_id}], "channelData": {"tenant": {"id": tenant_id}}}
         resp = self.post(self.CONVERSATION_URL, data=data)
@@ -101,34 +125,60 @@ class MsTeamsClient(MsTeamsClientABC, IntegrationProxyClient):
     @property
     def access_token(self) -> str:
         access_token = self.metadata["access_token"]
-        expires_at = self.metadata["expires_at"]
+        now = int(time.time())
+        # expires_at is stored as an absolute timestamp that already accounts for clock
+        # skew, so a token that hasn't reached it can be used as is.
+        if self.metadata["expires_at"] > now:
+            return access_token
 
         # We don't refresh the access token in cell silos.
         if SiloMode.get_current_mode() != SiloMode.CELL:
-            # if the token is expired, refresh it and save  it
-            if expires_at <= int(time.time()):
-                from copy import deepcopy
-
-                new_metadata = deepcopy(self.integration.metadata)
-
-                token_data = get_token_data()
-                access_token = token_data["access_token"]
-                new_metadata.update(token_data)
-
-                if (
-                    updated_integration := integration_service.update_integration(
-                        integration_id=self.integration.id,
-                        metadata=new_metadata,
-                    )
-                ) is None:
-                    # This should never happen, but if it does, fail loudly
-                    raise IntegrationError("Integration not found, failed to refresh access token")
-
-                self.integration = updated_integration
-                self.metadata = self.integration.metadata
-                self.base_url = self.metadata["service_url"].rstrip("/")
+            # the token is expired, refresh it and save it
+            access_token = self._get_or_refresh_token(now)["access_token"]
         return access_token
 
+    def _get_or_refresh_token(self, now: int) -> TokenData:
+        cache_key = f"msteams:token:{self.integration.id}"
+        token_data: TokenData | None = cache.get(cache_key)
+        if token_data is None or token_data["expires_at"] <= now:
+            lock = locks.get(
+                f"{cache_key}:refresh",
+                duration=TOKEN_REFRESH_LOCK_DURATION,
+                name="msteams_token_refresh",
+            )
+            try:
+                with lock.blocking_acquire(initial_delay=0.1, timeout=TOKEN_REFRESH_LOCK_TIMEOUT):
+                    # Another worker may have refreshed it while we were waiting.
+                    token_data = cache.get(cache_key)
+                    if token_data is None or token_data["expires_at"] <= now:
+                        token_data = self._refresh_access_token()
+                        cache.set(cache_key, token_data, token_data["expires_at"] - now)
+                        return token_data
+            except UnableToAcquireLock:
+                return self._refresh_access_token()
+
+        self.metadata = {**self.metadata, **token_data}
+        return token_data
+
+    def _refresh_access_token(self) -> TokenData:
+        token_data = get_token_data()
+        # The token data only replaces top-level scalar values, so a shallow copy suffices.
+        new_metadata = {**self.integration.metadata, **token_data}
+
+        if (
+            updated_integration := integration_service.update_integration(
+                integration_id=self.integration.id,
+                metadata=new_metadata,
+            )
+        ) is None:
+            # This should never happen, but if it does, fail loudly
+            raise IntegrationError("Integration not found, failed to refresh access token")
+
+        self.integration = updated_integration
+        self.metadata = self.integration.metadata
+        self.base_url = self.metadata["service_url"].rstrip("/")
+        return token_data
+
     @control_silo_function
     def authorize_request(self, prepared_request: PreparedRequest) -> PreparedRequest:
         prepared_request.headers["Authorization"] = f"Bearer {self.access_token}"
@@ -70,24 +70,11 @@ def find_channel_id(integration: Integration | RpcIntegration, name: str) -> str
         return filtered_channels[0].get("id")
 
     # handle searching for users
-    members = client.get_member_list(team_id, None)
-    for i in range(MSTEAMS_MAX_ITERS):
-        member_list = members.get("members")
-        continuation_token = members.get("continuationToken")
-
-        filtered_members = list(
-            filter(lambda x: x.get("name").lower() == name.lower(), member_list)
-        )
-        if len(filtered_members) > 0:
+    lowered_name = name.lower()
+    for member in client.iter_members(team_id, max_pages=MSTEAMS_MAX_ITERS):
+        if member.get("name").lower() == lowered_name:
             # TODO: handle duplicate username case
-            user_id = filtered_members[0].get("id")
-            tenant_id = filtered_members[0].get("tenantId")
-            return client.get_user_conversation_id(user_id, tenant_id)
-
-        if not continuation_token:
-            return None
-
-        members = client.get_member_list(team_id, continuation_token)
+            return client.get_user_conversation_id(member.get("id"), member.get("tenantId"))
 
     return None
 
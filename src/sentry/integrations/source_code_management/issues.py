@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from abc import ABC
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
+from django.urls import reverse
+
 from sentry.integrations.mixins.issues import IssueBasicIntegration
 from sentry.integrations.source_code_management.metrics import (
     SCMIntegrationInteractionEvent,
@@ -19,6 +22,11 @@ SOURCE_CODE_ISSUE_HALT_PATTERNS = {
 }
 
 
+@lru_cache(maxsize=4096)
+def _reverse_search_url(url_name: str, org_slug: str, integration_id: int) -> str:
+    return reverse(url_name, args=[org_slug, integration_id])
+
+
 class SourceCodeIssueIntegration(IssueBasicIntegration, BaseRepositoryIntegration, ABC):
     def record_event(self, event: SCMIntegrationInteractionType) -> SCMIntegrationInteractionEvent:
         return SCMIntegrationInteractionEvent(
@@ -28,6 +36,13 @@ class SourceCodeIssueIntegration(IssueBasicIntegration, BaseRepositoryIntegratio
             integration_id=self.org_integration.integration_id,
         )
 
+    def get_search_url(self, url_name: str, org_slug: str) -> str:
+        """
+        The autocomplete URL for this integration's issue/repository search endpoint.
+        It is rendered into every issue form, so resolved URLs are memoized.
+        """
+        return _reverse_search_url(url_name, org_slug, self.model.id)
+
     def _get_repository_choices(
         self,
         *,
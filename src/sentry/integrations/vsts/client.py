@@ -213,6 +213,14 @@ class VstsApiClient(IntegrationProxyClient, RepositoryClient):
                     self.identity, redirect_url=self.oauth_redirect_url
                 )
 
+    def refresh_auth_for_threaded_requests(self) -> None:
+        """
+        Loads the identity and refreshes it if expired, so that requests sent from worker
+        threads afterwards never touch the database. Regions are authorized by Control.
+        """
+        if not self._should_proxy_to_control:
+            self._refresh_auth_if_expired()
+
     @control_silo_function
     def authorize_request(
         self,
@@ -10,11 +10,16 @@ from sentry.models.repository import Repository
 from sentry.organizations.services.organization.model import RpcOrganization
 from sentry.plugins.providers import IntegrationRepositoryProvider
 from sentry.plugins.providers.integration_repository import RepositoryConfig
+from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 
 if TYPE_CHECKING:
     from sentry.integrations.vsts.integration import VstsIntegration as VstsIntegrationType  # NOQA
 
 MAX_COMMIT_DATA_REQUESTS = 90
+COMMIT_DATA_MAX_WORKERS = 8
+
+# https://docs.microsoft.com/en-us/rest/api/vsts/git/commits/get%20changes#versioncontrolchangetype
+_VSTS_CHANGE_TYPES = {"add": "A", "delete": "D", "edit": "M"}
 
 logger = logging.getLogger(__name__)
 
@@ -65,40 +70,50 @@ class VstsRepositoryProvider(IntegrationRepositoryProvider["VstsIntegrationType"
     def transform_changes(
         self, patch_set: Sequence[Mapping[str, Any]]
     ) -> Sequence[Mapping[str, str]]:
-        type_mapping = {"add": "A", "delete": "D", "edit": "M"}
-        file_changes = []
-        # https://docs.microsoft.com/en-us/rest/api/vsts/git/commits/get%20changes#versioncontrolchangetype
-        for change in patch_set:
-            change_type = type_mapping.get(change["changeType"])
-
-            if change_type and change.get("item") and change["item"]["gitObjectType"] == "blob":
-                file_changes.append({"path": change["item"]["path"], "type": change_type})
-
-        return file_changes
+        return [
+            {"path": item["path"], "type": change_type}
+            for change in patch_set
+            if (change_type := _VSTS_CHANGE_TYPES.get(change["changeType"]))
+            and (item := change.get("item"))
+            and item["gitObjectType"] == "blob"
+        ]
 
     def zip_commit_data(
         self, repo: Repository, commit_list: list[dict[str, Any]], organization_id: int
     ) -> list[dict[str, Any]]:
         assert repo.external_id is not None
+        repo_external_id = repo.external_id
         installation = self.get_installation(repo.integration_id, organization_id)
         client = installation.get_client()
-        n = 0
-        for commit in commit_list:
+
+        def fetch_commit_data(commit: dict[str, Any]) -> None:
             # Azure will truncate commit comments to only the first line.
             # We need to make an additional API call to get the full commit message.
             # This is important because issue refs could be anywhere in the commit
             # message.
             if commit.get("commentTruncated", False):
-                full_commit = client.get_commit(repo.external_id, commit["commitId"])
+                full_commit = client.get_commit(repo_external_id, commit["commitId"])
                 commit["comment"] = full_commit["comment"]
 
             commit["patch_set"] = self.transform_changes(
-                client.get_commit_filechanges(repo.external_id, commit["commitId"])
+                client.get_commit_filechanges(repo_external_id, commit["commitId"])
             )
-            # We only fetch patch data for 90 commits.
-            n += 1
-            if n > MAX_COMMIT_DATA_REQUESTS:
-                break
+
+        # We only fetch patch data for 90 commits.
+        commits = commit_list[:MAX_COMMIT_DATA_REQUESTS]
+        if not commits:
+            return commit_list
+
+        # Do the identity lookup and any token refresh here, so that the worker
+        # threads only make HTTP requests.
+        client.refresh_auth_for_threaded_requests()
+        with ContextPropagatingThreadPoolExecutor(
+            thread_name_prefix=__name__,
+            max_workers=min(COMMIT_DATA_MAX_WORKERS, len(commits)),
+        ) as executor:
+            # Consume the results so that any request error is raised here.
+            for _ in executor.map(fetch_commit_data, commits):
+                pass
 
         return commit_list
 
@@ -124,18 +139,23 @@ class VstsRepositoryProvider(IntegrationRepositoryProvider["VstsIntegrationType"
     def _format_commits(
         self, repo: Repository, commit_list: Sequence[Mapping[str, Any]]
     ) -> Sequence[Mapping[str, Any]]:
-        return [
-            {
-                "id": c["commitId"],
-                "repository": repo.name,
-                "author_email": c["author"]["email"],
-                "author_name": c["author"]["name"],
-                "message": c["comment"],
-                "patch_set": c.get("patch_set"),
-                "timestamp": self.format_date(c["author"]["date"]),
-            }
-            for c in commit_list
-        ]
+        repo_name = repo.name
+        format_date = self.format_date
+        commits = []
+        for c in commit_list:
+            author = c["author"]
+            commits.append(
+                {
+                    "id": c["commitId"],
+                    "repository": repo_name,
+                    "author_email": author["email"],
+                    "author_name": author["name"],
+                    "message": c["comment"],
+                    "patch_set": c.get("patch_set"),
+                    "timestamp": format_date(author["date"]),
+                }
+            )
+        return commits
 
     def repository_external_slug(self, repo: Repository) -> str | None:
         return repo.external_id
@@ -10,7 +10,7 @@ from sentry.models.groupinbox import bulk_remove_groups_from_inbox
 from sentry.signals import issue_unresolved
 from sentry.types.activity import ActivityType
 from sentry.types.group import GroupSubStatus
-from sentry.utils.tracing import set_span_tag, start_span
+from sentry.utils.tracing import set_span_data, set_span_tag, start_span
 
 TRANSITION_AFTER_DAYS = 7
 
@@ -23,12 +23,19 @@ def bulk_transition_group_to_ongoing(
 ) -> None:
     with start_span(name="groups_to_transition") as span:
         # make sure we don't update the Group when its already updated by conditionally updating the Group
-        groups_to_transition = Group.objects.filter(
-            id__in=group_ids, status=from_status, substatus=from_substatus
-        ).select_related("project")
-        set_span_tag(span, "group_ids", group_ids)
+        # Materialize once: the filter no longer matches after `update_group_status`, so later
+        # consumers must see the original rows rather than re-running the query.
+        groups_to_transition = list(
+            Group.objects.filter(
+                id__in=group_ids, status=from_status, substatus=from_substatus
+            ).select_related("project")
+        )
+        set_span_data(span, "group_ids_count", len(group_ids))
         set_span_tag(span, "groups_to_transition count", len(groups_to_transition))
 
+    if not groups_to_transition:
+        return
+
     with (
         start_span(name="update_group_status"),
         action_context_scope(source=ActionSource.SYSTEM, actor=SYSTEM_ACTOR),
@@ -43,10 +50,11 @@ def bulk_transition_group_to_ongoing(
             from_substatus=from_substatus,
         )
 
+    send_unresolved = from_status != GroupStatus.UNRESOLVED
     for group in groups_to_transition:
         group.status = GroupStatus.UNRESOLVED
         group.substatus = GroupSubStatus.ONGOING
-        if from_status != GroupStatus.UNRESOLVED:
+        if send_unresolved:
             issue_unresolved.send_robust(
                 project=group.project,
                 group=group,
@@ -1,7 +1,7 @@
 import functools
 import logging
 import os
-import re
+from pathlib import Path
 
 import orjson
 from django.conf import settings
@@ -11,69 +11,79 @@ import sentry
 
 logger = logging.getLogger("sentry")
 
-_version_regexp = re.compile(r"^\d+\.\d+\.\d+$")  # We really only want stable releases
+_V8 = Version("8")
 LOADER_FOLDER = os.path.abspath(os.path.join(os.path.dirname(sentry.__file__), "loader"))
+LOADER_PATH = Path(LOADER_FOLDER)
 
 
 @functools.lru_cache(maxsize=10)
 def load_registry(path):
     if "/" in path:
         return None
-    fn = os.path.join(LOADER_FOLDER, path + ".json")
     try:
-        with open(fn, "rb") as f:
-            return orjson.loads(f.read())
+        return orjson.loads((LOADER_PATH / f"{path}.json").read_bytes())
     except OSError:
         return None
 
 
+def _is_stable_release(version: str) -> bool:
+    # We really only want stable releases, i.e. plain `major.minor.patch` versions
+    parts = version.split(".")
+    return len(parts) == 3 and all(part.isdecimal() for part in parts)
+
+
 def get_highest_browser_sdk_version(versions):
-    full_versions = [x for x in versions if _version_regexp.match(x)]
-    return (
-        max(map(Version, full_versions))
-        if full_versions
-        else Version(settings.JS_SDK_LOADER_SDK_VERSION)
-    )
+    highest = None
+    for x in versions:
+        if _is_stable_release(x):
+            version = Version(x)
+            if highest is None or version > highest:
+                highest = version
+    return highest if highest is not None else Version(settings.JS_SDK_LOADER_SDK_VERSION)
 
 
 def get_all_browser_sdk_version_versions():
     return ["latest", "10.x", "9.x", "8.x", "7.x", "6.x", "5.x", "4.x"]
 
 
-def get_all_browser_sdk_version_choices():
-    versions = get_all_browser_sdk_version_versions()
+_ALL_BROWSER_SDK_VERSION_CHOICES = tuple(
+    (version, version) for version in get_all_browser_sdk_version_versions()
+)
 
-    rv = []
-    for version in versions:
-        rv.append((version, version))
-    return tuple(rv)
 
+def get_all_browser_sdk_version_choices():
+    return _ALL_BROWSER_SDK_VERSION_CHOICES
 
-def get_browser_sdk_version_choices(project):
-    versions = get_available_sdk_versions_for_project(project)
 
-    rv = []
-    for version in versions:
-        rv.append((version, version))
-    return tuple(rv)
+def get_browser_sdk_version_choices(project):
+    return tuple((version, version) for version in get_available_sdk_versions_for_project(project))
 
 
+@functools.lru_cache(maxsize=1)
 def load_version_from_file():
     data = load_registry("_registry")
     if data:
-        return data.get("versions", [])
-    return []
+        return tuple(data.get("versions", ()))
+    return ()
 
 
 def match_selected_version_to_browser_sdk_version(selected_version):
-    versions = load_version_from_file()
+    return _match_selected_version_to_browser_sdk_version(
+        selected_version, tuple(load_version_from_file()), settings.JS_SDK_LOADER_SDK_VERSION
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _match_selected_version_to_browser_sdk_version(selected_version, versions, default_version):
+    # This runs for every loader request, but there are only a handful of selectable
+    # versions and the registry doesn't change within a process. The default version is
+    # only part of the cache key, as it is the fallback when nothing matches.
     if selected_version == "latest":
         # "latest" as an option is phased out before the v8 release of the JS SDK, meaning that we pin people to the latest pre-v8-version when they have "latest" selected
-        return get_highest_browser_sdk_version([x for x in versions if Version(x) < Version("8")])
-    return get_highest_browser_sdk_version(
-        # Filter for all versions that match the selected versions major
-        [x for x in versions if x.startswith(selected_version[0])]
-    )
+        return get_highest_browser_sdk_version(x for x in versions if Version(x) < _V8)
+    # Filter for all versions that match the selected versions major
+    major = selected_version[0]
+    return get_highest_browser_sdk_version(x for x in versions if x.startswith(major))
 
 
 def get_browser_sdk_version(project_key) -> Version:
@@ -57,19 +57,20 @@ def create_link(
     assert isinstance(installation, IssueBasicIntegration), (
         "Installation must be an IssueBasicIntegration to create a link"
     )
+    group = event.group
     external_issue_key = installation.make_external_key(response)
 
     external_issue = ExternalIssue.objects.create(
-        organization_id=event.group.project.organization_id,
+        organization_id=group.project.organization_id,
         integration_id=integration.id,
         key=external_issue_key,
         title=event.title,
-        description=installation.get_group_description(event.group, event),
+        description=installation.get_group_description(group, event),
         metadata=response.get("metadata"),
     )
     GroupLink.objects.create(
-        group_id=event.group.id,
-        project_id=event.group.project_id,
+        group_id=group.id,
+        project_id=group.project_id,
         linked_type=GroupLink.LinkedType.issue,
         linked_id=external_issue.id,
         relationship=GroupLink.Relationship.references,
@@ -77,7 +78,7 @@ def create_link(
     )
     issue_url = response.get("url") or installation.get_issue_url(external_issue.key)
     Activity.objects.create_group_activity(
-        group=event.group,
+        group=group,
         type=ActivityType.CREATE_ISSUE,
         data={
             "title": external_issue.title,
@@ -94,8 +95,8 @@ def create_link(
             external_issue_key=external_issue.key,
         ),
         source=ActionSource.SYSTEM,
-        group_id=event.group.id,
-        project=event.group.project,
+        group_id=group.id,
+        project=group.project,
         actor=SYSTEM_ACTOR,
     )
 
@@ -106,10 +107,10 @@ def build_description_workflow_engine_ui(
     installation: IssueBasicIntegration,
     generate_footer: Callable[[str], str],
 ) -> str:
-    project = event.group.project
-    workflow_url = create_link_to_workflow(project.organization.slug, str(workflow_id))
+    group = event.group
+    workflow_url = create_link_to_workflow(group.project.organization.slug, str(workflow_id))
 
-    description: str = installation.get_group_description(event.group, event) + generate_footer(
+    description: str = installation.get_group_description(group, event) + generate_footer(
         workflow_url
     )
     return description
@@ -124,20 +125,26 @@ def build_description(
     """
     Format the description of the ticket/work item
     """
-    project = event.group.project
+    group = event.group
+    project = group.project
     rule_url = (
         f"/organizations/{project.organization.slug}/issues/alerts/rules/{project.slug}/{rule_id}/"
     )
 
-    description: str = installation.get_group_description(event.group, event) + generate_footer(
-        rule_url
-    )
+    description: str = installation.get_group_description(group, event) + generate_footer(rule_url)
     return description
 
 
 def create_issue(event: GroupEvent, futures: Sequence[RuleFuture]) -> None:
     """Create an issue for a given event"""
-    organization = event.group.project.organization
+    group = event.group
+    project = group.project
+    organization = project.organization
+    # Futures are keyed by provider and integration, so in practice they all share one
+    # integration. Resolve each distinct one once rather than once per future.
+    integrations: dict[tuple[int | None, str | None], RpcIntegration | None] = {}
+    installations: dict[int, IntegrationInstallation] = {}
+    linked_integration_ids = ExternalIssue.objects.get_linked_integration_ids(event)
 
     for future in futures:
         rule_id = future.rule.id
@@ -151,22 +158,26 @@ def create_issue(event: GroupEvent, futures: Sequence[RuleFuture]) -> None:
         action_id = rule_id
         rule_id = data.get("legacy_rule_id")
 
-        integration = integration_service.get_integration(
-            integration_id=integration_id,
-            provider=provider,
-            organization_id=organization.id,
-            status=ObjectStatus.ACTIVE,
-        )
+        if (integration_id, provider) not in integrations:
+            integrations[(integration_id, provider)] = integration_service.get_integration(
+                integration_id=integration_id,
+                provider=provider,
+                organization_id=organization.id,
+                status=ObjectStatus.ACTIVE,
+            )
+        integration = integrations[(integration_id, provider)]
         if not integration:
             # Integration removed, rule still active.
             return
 
-        installation = integration.get_installation(organization.id)
+        if integration.id not in installations:
+            installations[integration.id] = integration.get_installation(organization.id)
+        installation = installations[integration.id]
 
         assert isinstance(installation, IssueBasicIntegration), (
             "Installation must be an IssueBasicIntegration to create a ticket"
         )
-        data["title"] = installation.get_group_title(event.group, event)
+        data["title"] = installation.get_group_title(group, event)
 
         workflow_id = data.get("workflow_id")
         if workflow_id is not None:
@@ -179,14 +190,14 @@ def create_issue(event: GroupEvent, futures: Sequence[RuleFuture]) -> None:
         if data.get("dynamic_form_fields"):
             del data["dynamic_form_fields"]
 
-        if ExternalIssue.objects.has_linked_issue(event, integration):
+        if integration.id in linked_integration_ids:
             logger.info(
                 "%s.rule_trigger.link_already_exists",
                 provider,
                 extra={
                     "rule_id": rule_id,
-                    "project_id": event.group.project.id,
-                    "group_id": event.group.id,
+                    "project_id": project.id,
+                    "group_id": group.id,
                 },
             )
             return
@@ -219,3 +230,4 @@ def create_issue(event: GroupEvent, futures: Sequence[RuleFuture]) -> None:
             # If we successfully created the issue, we want to create the link
             else:
                 create_link(integration, installation, event, response)
+                linked_integration_ids.add(integration.id)
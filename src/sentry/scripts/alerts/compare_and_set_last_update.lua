@@ -0,0 +1,15 @@
+-- Store a last_update timestamp only if it is newer than the one already stored.
+assert(#KEYS == 1, "provide exactly one last_update key")
+assert(#ARGV == 2, "provide a timestamp and a TTL")
+
+local key = KEYS[1]
+local timestamp = ARGV[1]
+local ttl = ARGV[2]
+
+local current = redis.call("GET", key)
+if current and tonumber(current) >= tonumber(timestamp) then
+    return 0
+end
+
+redis.call("SET", key, timestamp, "EX", ttl)
+return 1
@@ -9,10 +9,12 @@ from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 from datetime import datetime, timedelta
 from enum import Enum, auto
-from hashlib import md5
 from math import floor
+from operator import itemgetter
 from typing import Any, TypedDict, cast
 
+import mmh3
+import orjson
 import sentry_sdk
 from django.db.models import F
 from django.utils import timezone
@@ -48,7 +50,11 @@ from sentry.models.project import Project
 from sentry.models.team import Team
 from sentry.search.eap.occurrences.rollout_utils import EAPOccurrencesComparator
 from sentry.search.eap.occurrences.search_executor import EAP_SORT_STRATEGIES, run_eap_group_search
-from sentry.search.events.filter import convert_search_filter_to_snuba_query, format_search_filter
+from sentry.search.events.filter import (
+    FilterConvertParams,
+    convert_search_filter_to_snuba_query,
+    format_search_filter,
+)
 from sentry.snuba.dataset import Dataset
 from sentry.types.activity import ActivityType
 from sentry.types.group import GroupSubStatus
@@ -152,7 +158,11 @@ def _reasonable_search_result_match(
     return experimental_group_ids.issubset(control_group_ids)
 
 
-@dataclass
+TRENDS_LOG_LEVEL_SCORE = "multiIf(equals(level, 'fatal'), 1.0, equals(level, 'error'), 0.66, equals(level, 'warning'), 0.33, 0.0)"
+TRENDS_STACKTRACE_SCORE = "if(notEmpty(exception_stacks.type), 1.0, 0.0)"
+
+
+@dataclass(frozen=True)
 class TrendsParams:
     # (event or issue age_hours) / (event or issue halflife hours)
     # any event or issue age that is greater than max_pow times the half-life hours will get clipped
@@ -199,6 +209,31 @@ def get_search_filter(
     return found_val
 
 
+def get_search_filter_date_bounds(
+    search_filters: Sequence[SearchFilter] | None,
+) -> tuple[datetime | None, datetime | None]:
+    """
+    Finds the most restrictive lower and upper bounds set by `date` and `timestamp` search
+    filters in a single pass. Equivalent to combining `get_search_filter` for both fields with
+    the `>` and `<` operators.
+    :param search_filters: collection of `SearchFilter` objects
+    :return: A `(start, end)` tuple, with `None` for a bound that isn't set
+    """
+    # SearchFilter values are an unsound union, so these stay untyped until returned
+    start: Any = None
+    end: Any = None
+    for search_filter in search_filters or ():
+        if search_filter.key.name not in ("date", "timestamp"):
+            continue
+        operator = search_filter.operator
+        val = search_filter.value.raw_value
+        if operator.startswith(">"):
+            start = max(val, start) if start else val
+        elif operator.startswith("<"):
+            end = min(val, end) if end else val
+    return start, end
+
+
 def group_categories_from_search_filters(search_filters: Sequence[SearchFilter]) -> set[int]:
     group_categories = group_categories_from(search_filters)
     if group_categories:
@@ -251,6 +286,12 @@ class AbstractQueryExecutor(metaclass=ABCMeta):
     def postgres_only_fields(self) -> set[str]:
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def non_snuba_fields(self) -> frozenset[str]:
+        """Search filter keys that are never sent to snuba, we special case date"""
+        raise NotImplementedError
+
     @abstractmethod
     def query(
         self,
@@ -285,14 +326,15 @@ class AbstractQueryExecutor(metaclass=ABCMeta):
     ) -> list[Any | None]:
         """Converts the SearchFilter format into snuba-compatible clauses"""
         converted_filters: list[Sequence[Any] | None] = []
+        # The params are the same for every filter, so build them once
+        params: FilterConvertParams = {
+            "organization_id": organization_id,
+            "project_id": project_ids,
+            "environment": environments,
+        }
         for search_filter in search_filters or ():
             conditions, projects_to_filter, group_ids = format_search_filter(
-                search_filter,
-                params={
-                    "organization_id": organization_id,
-                    "project_id": project_ids,
-                    "environment": environments,
-                },
+                search_filter, params=params
             )
 
             # if no re-formatted conditions, use fallback method for selected groups
@@ -300,14 +342,7 @@ class AbstractQueryExecutor(metaclass=ABCMeta):
             if conditions:
                 new_condition = conditions[0]
             elif group_ids:
-                new_condition = convert_search_filter_to_snuba_query(
-                    search_filter,
-                    params={
-                        "organization_id": organization_id,
-                        "project_id": project_ids,
-                        "environment": environments,
-                    },
-                )
+                new_condition = convert_search_filter_to_snuba_query(search_filter, params=params)
 
             if new_condition:
                 converted_filters.append(new_condition)
@@ -370,10 +405,11 @@ class AbstractQueryExecutor(metaclass=ABCMeta):
         # categorize the clauses into having or condition clauses
         having = []
         conditions = []
+        aggregation_defs = self.aggregation_defs
         for search_filter, converted_filter in zip(search_filters, converted_filters):
             if converted_filter is not None:
                 # Ensure that no user-generated tags that clashes with aggregation_defs is added to having
-                if search_filter.key.name in self.aggregation_defs and not search_filter.key.is_tag:
+                if search_filter.key.name in aggregation_defs and not search_filter.key.is_tag:
                     having.append(converted_filter)
                 else:
                     conditions.append(converted_filter)
@@ -388,7 +424,13 @@ class AbstractQueryExecutor(metaclass=ABCMeta):
 
         selected_columns = []
         if get_sample:
-            query_hash = md5(json.dumps(conditions).encode("utf-8")).hexdigest()[:8]
+            # The hash only seeds the sampler, so a fast non-cryptographic 32 bit hash is enough
+            query_hash = format(
+                mmh3.hash(
+                    orjson.dumps(conditions, default=json.better_default_encoder), signed=False
+                ),
+                "08x",
+            )
             selected_columns.append(["cityHash64", [f"'{query_hash}'", "group_id"], "sample"])
             orderby = ["sample"]
         else:
@@ -457,20 +499,20 @@ class AbstractQueryExecutor(metaclass=ABCMeta):
         environments = None
         if environment_ids is not None:
             filters["environment"] = environment_ids
-            environments = list(
-                Environment.objects.filter(
-                    organization_id=organization.id, id__in=environment_ids
-                ).values_list("name", flat=True)
-            )
+            # Environments are cached by id, which saves a query on every filtered search.
+            environments = [
+                env.name
+                for env in Environment.objects.get_many_from_cache(environment_ids)
+                if env.organization_id == organization.id
+            ]
 
         referrer = referrer or "search"
         referrer = f"{referrer}_sample" if get_sample else referrer
 
+        # remove any search_filters that are only available in postgres, we special case date
+        non_snuba_fields = self.non_snuba_fields
         snuba_search_filters = [
-            sf
-            for sf in search_filters or ()
-            # remove any search_filters that are only available in postgres, we special case date
-            if sf.key.name not in self.postgres_only_fields.union(["date", "timestamp"])
+            sf for sf in search_filters or () if sf.key.name not in non_snuba_fields
         ]
 
         # common pinned parameters that won't change based off datasource
@@ -588,11 +630,13 @@ class AbstractQueryExecutor(metaclass=ABCMeta):
                 if bulk_result:
                     if bulk_result["data"]:
                         rows.extend(bulk_result["data"])
+                        row_length += len(bulk_result["data"])
                     if bulk_result["totals"]["total"]:
                         total += bulk_result["totals"]["total"]
-                    row_length += len(bulk_result)
 
-            rows.sort(key=lambda row: row["group_id"])
+            # Per-category results are ordered by score, not group_id, so they can't simply be
+            # merged; sort the combined rows so ties between categories resolve deterministically.
+            rows.sort(key=itemgetter("group_id"))
 
             if not get_sample:
                 metrics.distribution("snuba.search.num_result_groups", row_length)
@@ -716,6 +760,32 @@ def trends_aggregation_impl(
     start: datetime,
     end: datetime,
 ) -> Sequence[str]:
+    date_period = end - start
+    if not params.v2 or date_period.days >= 7:
+        # Only short v2 windows depend on the exact date range. Every other expression is
+        # built from a small set of inputs, so it is reused across searches.
+        expression = _cached_trends_aggregation_expression(
+            params, timestamp_column, use_stacktrace, 3600 * 24 * 7, 3600
+        )
+    else:
+        overall_event_count_seconds = int(date_period.total_seconds())
+        expression = _trends_aggregation_expression(
+            params,
+            timestamp_column,
+            use_stacktrace,
+            overall_event_count_seconds,
+            floor(overall_event_count_seconds * 0.01),
+        )
+    return [expression, ""]
+
+
+def _trends_aggregation_expression(
+    params: TrendsParams,
+    timestamp_column: str,
+    use_stacktrace: bool,
+    overall_event_count_seconds: int,
+    recent_event_count_seconds: int,
+) -> str:
     min_score = params.min_score
     max_pow = params.max_pow
     event_age_weight = params.event_age_weight
@@ -728,8 +798,8 @@ def trends_aggregation_impl(
 
     event_age_hours = f"divide(now() - {timestamp_column}, 3600)"
     issue_age_hours = f"divide(now() - min({timestamp_column}), 3600)"
-    log_level_score = "multiIf(equals(level, 'fatal'), 1.0, equals(level, 'error'), 0.66, equals(level, 'warning'), 0.33, 0.0)"
-    stacktrace_score = "if(notEmpty(exception_stacks.type), 1.0, 0.0)"
+    log_level_score = TRENDS_LOG_LEVEL_SCORE
+    stacktrace_score = TRENDS_STACKTRACE_SCORE
     # event_agg_rank:
     #   ls = log_level_score    {1.0, 0.66, 0.33, 0}
     #   lw = log_level_weight   [0, 10]
@@ -758,7 +828,7 @@ def trends_aggregation_impl(
 
     if not params.v2:
         aggregate_event_score = f"greatest({min_score}, sum(divide({event_agg_rank}, pow(2, least({max_pow}, divide({event_age_hours}, {event_halflife_hours}))))))"
-        return [f"multiply({aggregate_event_score}, {aggregate_issue_score})", ""]
+        return f"multiply({aggregate_event_score}, {aggregate_issue_score})"
     else:
         #  * apply log to event score summation to clamp the contribution of event scores to a reasonable maximum
         #  * add an extra 'relative volume score' (# of events in past 60 mins / # of events in the past 7 days)
@@ -787,15 +857,6 @@ def trends_aggregation_impl(
         # ln(h(x)) = [ln(1), ln(+inf)] = 0, 1, ~2.30, ~6.09,  ~13.81,     ~20.72, +inf
         aggregate_event_score = f"log(plus(1, sum(divide({event_agg_rank}, pow(2, divide({event_age_hours}, {event_halflife_hours}))))))"
 
-        date_period = end - start
-
-        if date_period.days >= 7:
-            overall_event_count_seconds = 3600 * 24 * 7
-            recent_event_count_seconds = 3600
-        else:
-            overall_event_count_seconds = int(date_period.total_seconds())
-            recent_event_count_seconds = floor(overall_event_count_seconds * 0.01)
-
         recent_event_count = (
             f"countIf(lessOrEquals(minus(now(), {timestamp_column}), {recent_event_count_seconds}))"
         )
@@ -808,10 +869,7 @@ def trends_aggregation_impl(
         scaled_relative_volume_score = f"divide(multiply({relative_volume_weight}, {relative_volume_score}), {max_relative_volume_weight})"
 
         if not params.normalize:
-            return [
-                f"multiply(multiply({aggregate_issue_score}, greatest({min_score}, {aggregate_event_score})), greatest({min_score}, {scaled_relative_volume_score}))",
-                "",
-            ]
+            return f"multiply(multiply({aggregate_issue_score}, greatest({min_score}, {aggregate_event_score})), greatest({min_score}, {scaled_relative_volume_score}))"
         else:
             # aggregate_issue_score:
             #   x = issue_age_hours
@@ -832,10 +890,12 @@ def trends_aggregation_impl(
             # aggregate_event_score to reach to upper limit of ~21 (and normalized score of 1)
             normalized_aggregate_event_score = f"divide(least({aggregate_event_score}, 21), 21)"
 
-            return [
-                f"plus(plus({normalized_aggregate_issue_score}, {normalized_aggregate_event_score}), {normalized_relative_volume_score})",
-                "",
-            ]
+            return f"plus(plus({normalized_aggregate_issue_score}, {normalized_aggregate_event_score}), {normalized_relative_volume_score})"
+
+
+_cached_trends_aggregation_expression = functools.lru_cache(maxsize=512)(
+    _trends_aggregation_expression
+)
 
 
 def _recommended_aggregation(
@@ -1233,6 +1293,7 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
         "recommended": ["last_seen", "times_seen", "user_count"],
     }
     postgres_only_fields = {*SKIP_SNUBA_FIELDS, "regressed_in_release"}
+    non_snuba_fields = frozenset({*postgres_only_fields, "date", "timestamp"})
     # add specific fields here on top of skip_snuba_fields from the serializer
     sort_strategies = {
         "date": "last_seen",
@@ -1322,7 +1383,7 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
         # group's max event timestamp). When Snuba runs it enforces the full event window.
         group_queryset = group_queryset.filter(last_seen__gte=start)
 
-        non_snuba_fields = self.postgres_only_fields.union({"date", "timestamp"})
+        non_snuba_fields = self.non_snuba_fields
         has_snuba_filters = any(
             sf.key.name not in non_snuba_fields for sf in (search_filters or ())
         )
@@ -1733,15 +1794,8 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
         end = None
         paginator_options = {} if paginator_options is None else paginator_options
 
-        end_params = [
-            _f
-            for _f in [
-                date_to,
-                get_search_filter(search_filters, "date", "<"),
-                get_search_filter(search_filters, "timestamp", "<"),
-            ]
-            if _f
-        ]
+        filter_start, filter_end = get_search_filter_date_bounds(search_filters)
+        end_params = [_f for _f in [date_to, filter_end] if _f]
         if end_params:
             end = min(end_params)
 
@@ -1762,12 +1816,7 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
         # apparently `retention_window_start` can be None(?), so we need a
         # fallback.
         retention_date = max(_f for _f in [retention_window_start, now - timedelta(days=90)] if _f)
-        start_params = [
-            date_from,
-            retention_date,
-            get_search_filter(search_filters, "date", ">"),
-            get_search_filter(search_filters, "timestamp", ">"),
-        ]
+        start_params = [date_from, retention_date, filter_start]
         start = max(_f for _f in start_params if _f)
         end = max([retention_date, end])
 
@@ -1840,11 +1889,7 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
             and sort_by == "date"
             and
             # This handles tags and date parameters for search filters.
-            not [
-                sf
-                for sf in (search_filters or ())
-                if sf.key.name not in self.postgres_only_fields.union(["date", "timestamp"])
-            ]
+            not any(sf.key.name not in self.non_snuba_fields for sf in (search_filters or ()))
         ):
             group_queryset = (
                 group_queryset.using_replica()
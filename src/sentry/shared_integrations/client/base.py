@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import logging
+import threading
 from collections.abc import Callable, Mapping, MutableMapping, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from http.cookiejar import DefaultCookiePolicy
 from types import TracebackType
 from typing import Any, Literal, NotRequired, Self, TypedDict, TypeVar, overload
 
@@ -39,6 +42,10 @@ class SessionSettings(TypedDict):
 
 _TPaginatedResult = TypeVar("_TPaginatedResult")
 
+# Sessions shared across requests by clients that opt into `reuse_session`, keyed by client class.
+_shared_sessions: dict[type[BaseApiClient], SafeSession] = {}
+_shared_sessions_lock = threading.Lock()
+
 
 class BaseApiClient:
     base_url: str = ""
@@ -57,6 +64,10 @@ class BaseApiClient:
 
     page_number_limit = 10
 
+    # Keep a single session per client class for the lifetime of the process, so connections
+    # (and their TLS handshakes) are reused across requests instead of being opened per request.
+    reuse_session: bool = False
+
     integration_name: str
 
     # Timeout for both the connect and the read timeouts.
@@ -188,6 +199,26 @@ class BaseApiClient:
         """
         return build_session()
 
+    def get_session(self) -> AbstractContextManager[SafeSession]:
+        """
+        Returns the session to send a request with. Unless the client sets `reuse_session`,
+        a new session is built for every request and closed afterwards.
+        """
+        if not self.reuse_session:
+            return self.build_session()
+
+        client_class = type(self)
+        session = _shared_sessions.get(client_class)
+        if session is None:
+            with _shared_sessions_lock:
+                session = _shared_sessions.get(client_class)
+                if session is None:
+                    session = self.build_session()
+                    # The session is shared between installations, so never keep cookies.
+                    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                    _shared_sessions[client_class] = session
+        return nullcontext(session)
+
     @staticmethod
     def _normalize_cert_setting(cert_setting: object) -> str | tuple[str, str] | None:
         # ``requests`` accepts cert as None, a single cert path, or a
@@ -346,7 +377,7 @@ class BaseApiClient:
             extra["api_request_type"] = api_request_type_tag
 
         try:
-            with self.build_session() as session:
+            with self.get_session() as session:
                 finalized_request = self.finalize_request(_prepared_request)
                 self.set_proxy_request_options(finalized_request, timeout)
                 environment_settings = session.merge_environment_settings(
@@ -0,0 +1,18 @@
+import orjson
+from rest_framework.exceptions import ErrorDetail
+
+from sentry.api.renderers import ORJSONRenderer
+
+
+def test_render() -> None:
+    data = [{"label": "#123 Issue Title 123", "value": "123"}]
+    assert orjson.loads(ORJSONRenderer().render(data)) == data
+
+
+def test_render_none() -> None:
+    assert ORJSONRenderer().render(None) == b""
+
+
+def test_render_error_detail() -> None:
+    data = {"field": [ErrorDetail("This field is required.", code="required")]}
+    assert orjson.loads(ORJSONRenderer().render(data)) == {"field": ["This field is required."]}
@@ -10,6 +10,8 @@ from django.utils import timezone
 from sentry.incidents.grouptype import MetricIssue
 from sentry.incidents.subscription_processor import (
     SubscriptionProcessor,
+    compare_and_store_detector_last_update,
+    get_detector_last_update,
     store_detector_last_update,
 )
 from sentry.incidents.utils.constants import INCIDENTS_SNUBA_SUBSCRIPTION_TYPE
@@ -19,6 +21,7 @@ from sentry.snuba.models import QuerySubscription, SnubaQuery, SnubaQueryEventTy
 from sentry.snuba.subscriptions import create_snuba_query, create_snuba_subscription
 from sentry.testutils.cases import SnubaTestCase, SpanTestCase, TestCase
 from sentry.testutils.helpers.datetime import freeze_time
+from sentry.utils.dates import to_datetime
 from sentry.workflow_engine.models import DataSource, DataSourceDetector, DetectorState
 from sentry.workflow_engine.models.data_condition import Condition, DataCondition
 from sentry.workflow_engine.models.detector import Detector
@@ -239,6 +242,39 @@ class TestSubscriptionProcessorLastUpdate(ProcessUpdateBaseClass):
 
         assert result is False
 
+    def test_skips_duplicate_update(self) -> None:
+        assert self.send_update(self.critical_threshold + 1) is True
+        assert self.send_update(self.critical_threshold + 1) is False
+        self.metrics.incr.assert_any_call("incidents.alert_rules.skipping_already_processed_update")
+
+    def test_failed_update_is_not_marked_processed(self) -> None:
+        with (
+            mock.patch.object(
+                SubscriptionProcessor,
+                "process_results_workflow_engine",
+                side_effect=Exception("boom"),
+            ),
+            pytest.raises(Exception),
+        ):
+            self.send_update(self.critical_threshold + 1)
+
+        assert get_detector_last_update(self.metric_detector, self.project.id) == to_datetime(0)
+        assert self.send_update(self.critical_threshold + 1) is True
+
+    def test_compare_and_store_detector_last_update(self) -> None:
+        now = timezone.now().replace(microsecond=0)
+        assert compare_and_store_detector_last_update(self.metric_detector, self.project.id, now)
+        assert get_detector_last_update(self.metric_detector, self.project.id) == now
+        assert not compare_and_store_detector_last_update(
+            self.metric_detector, self.project.id, now
+        )
+        assert not compare_and_store_detector_last_update(
+            self.metric_detector, self.project.id, now - timedelta(minutes=1)
+        )
+        later = now + timedelta(minutes=1)
+        assert compare_and_store_detector_last_update(self.metric_detector, self.project.id, later)
+        assert get_detector_last_update(self.metric_detector, self.project.id) == later
+
     def test_no_detector_returns_false_without_exception(self) -> None:
         with self.tasks():
             snuba_query = create_snuba_query(
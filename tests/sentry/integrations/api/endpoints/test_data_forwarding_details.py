@@ -213,6 +213,40 @@ class DataForwardingDetailsPutTest(DataForwardingDetailsEndpointTest):
         )
         assert project_config2.is_enabled
 
+    def test_update_with_project_write_reenrolls_disabled_project(self) -> None:
+        data_forwarder = self.create_data_forwarder(
+            provider=DataForwarderProviderSlug.SEGMENT,
+            config={"write_key": "test_key"},
+        )
+
+        project = self.create_project(organization=self.organization)
+        self.create_data_forwarder_project(
+            data_forwarder=data_forwarder,
+            project=project,
+            is_enabled=False,
+            overrides={"write_key": "project_key"},
+        )
+
+        user = self.create_user()
+        self.create_member(
+            user=user,
+            organization=self.organization,
+            role="member",
+            teams=[self.team],
+            teamRole="admin",
+        )
+        self.login_as(user=user)
+
+        self.get_success_response(
+            self.organization.slug, data_forwarder.id, status_code=200, project_ids=[project.id]
+        )
+
+        project_config = DataForwarderProject.objects.get(
+            data_forwarder=data_forwarder, project=project
+        )
+        assert project_config.is_enabled
+        assert project_config.overrides == {"write_key": "project_key"}
+
     def test_update_project_overrides_with_project_write(self) -> None:
         """Test updating a single project's overrides and is_enabled by project:write user"""
         data_forwarder = self.create_data_forwarder(
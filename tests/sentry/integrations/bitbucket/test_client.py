@@ -2,8 +2,13 @@ import jwt
 import pytest
 import responses
 from requests import Request
+from urllib3.response import HTTPResponse
 
-from sentry.integrations.bitbucket.client import BitbucketApiClient, BitbucketAPIPath
+from sentry.integrations.bitbucket.client import (
+    MAX_RETRY_AFTER_SECONDS,
+    BitbucketApiClient,
+    BitbucketAPIPath,
+)
 from sentry.integrations.bitbucket.integration import BitbucketIntegration
 from sentry.integrations.utils.atlassian_connect import get_query_hash
 from sentry.models.repository import Repository
@@ -86,6 +91,19 @@ class BitbucketApiClientTest(TestCase, BaseTestCase):
             "sub": self.integration.external_id,
         }
 
+    def test_build_session_retries_rate_limited_reads(self) -> None:
+        session = self.bitbucket_client.build_session()
+        retries = session.get_adapter("https://api.bitbucket.org").max_retries
+
+        assert retries.total == 3
+        assert retries.respect_retry_after_header
+        assert retries.is_retry("GET", 429)
+        assert retries.is_retry("GET", 503)
+        assert not retries.is_retry("POST", 429)
+
+        response = HTTPResponse(status=429, headers={"Retry-After": "600"})
+        assert retries.get_retry_after(response) == MAX_RETRY_AFTER_SECONDS
+
     @responses.activate
     def test_check_file(self) -> None:
         path = "src/sentry/integrations/bitbucket/client.py"
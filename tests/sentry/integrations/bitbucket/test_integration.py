@@ -166,6 +166,10 @@ class BitbucketIntegrationTest(APITestCase):
         ]
         assert len(responses.calls) == 1
 
+    def test_get_client_is_reused(self) -> None:
+        installation = self.integration.get_installation(self.organization.id)
+        assert installation.get_client() is installation.get_client()
+
     @responses.activate
     def test_get_repositories_exact_match(self) -> None:
         querystring = urlencode({"q": 'name="stuf"'})
@@ -1,12 +1,16 @@
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 import responses
 from django.urls import reverse
 
+from sentry.integrations.bitbucket.search import _get_error_message
 from sentry.integrations.source_code_management.metrics import SourceCodeSearchEndpointHaltReason
 from sentry.integrations.types import EventLifecycleOutcome
+from sentry.shared_integrations.exceptions import ApiError
 from sentry.testutils.asserts import assert_halt_metric, assert_middleware_metrics
 from sentry.testutils.cases import APITestCase
+from sentry.testutils.helpers.datetime import freeze_time
 from sentry.testutils.silo import control_silo_test
 
 
@@ -125,3 +129,102 @@ class BitbucketSearchEndpointTest(APITestCase):
         # NOTE: handle_search_issues returns without raising an API error, so for the
         # purposes of logging the GET request completes successfully
         assert halt2.args[0] == EventLifecycleOutcome.SUCCESS
+
+    @responses.activate
+    def test_search_issues_reuses_recent_results(self) -> None:
+        search_response = responses.add(
+            responses.GET,
+            "https://api.bitbucket.org/2.0/repositories/meredithanya/apples/issues",
+            json={"values": [{"id": "123", "title": "Issue Title 123"}]},
+        )
+
+        for query in ("issue", "issue", "other"):
+            resp = self.client.get(
+                self.path,
+                data={"field": "externalIssue", "query": query, "repo": "meredithanya/apples"},
+            )
+            assert resp.status_code == 200
+            assert resp.data == [{"label": "#123 Issue Title 123", "value": "123"}]
+
+        assert search_response.call_count == 2
+
+    @responses.activate
+    def test_search_issues_caches_plain_payload(self) -> None:
+        responses.add(
+            responses.GET,
+            "https://api.bitbucket.org/2.0/repositories/meredithanya/apples/issues",
+            json={"values": [{"id": "123", "title": "Issue Title 123"}]},
+        )
+        installation = self.integration.get_installation(self.organization.id)
+
+        for _ in range(2):
+            results = installation.search_issues(query="issue", repo="meredithanya/apples")
+            assert type(results) is dict
+            assert results == {"values": [{"id": "123", "title": "Issue Title 123"}]}
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_search_issues_revalidates_with_etag(self) -> None:
+        url = "https://api.bitbucket.org/2.0/repositories/meredithanya/apples/issues"
+        responses.add(
+            responses.GET,
+            url,
+            json={"values": [{"id": "123", "title": "Issue Title 123"}]},
+            headers={"ETag": '"abc"'},
+        )
+        responses.add(responses.GET, url, status=304, body="")
+        data = {"field": "externalIssue", "query": "issue", "repo": "meredithanya/apples"}
+
+        with freeze_time() as frozen_time:
+            resp = self.client.get(self.path, data=data)
+            assert resp.status_code == 200
+
+            frozen_time.shift(timedelta(minutes=1))
+            resp = self.client.get(self.path, data=data)
+
+        assert resp.status_code == 200
+        assert resp.data == [{"label": "#123 Issue Title 123", "value": "123"}]
+        assert len(responses.calls) == 2
+        assert "If-None-Match" not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers["If-None-Match"] == '"abc"'
+
+    @responses.activate
+    def test_search_issues_repository_not_found(self) -> None:
+        responses.add(
+            responses.GET,
+            "https://api.bitbucket.org/2.0/repositories/meredithanya/apples/issues",
+            json={"type": "error", "error": {"message": "Resource not found"}},
+            status=404,
+        )
+        resp = self.client.get(
+            self.path,
+            data={"field": "externalIssue", "query": "issue", "repo": "meredithanya/apples"},
+        )
+        assert resp.status_code == 400
+        assert resp.data == {"detail": "Bitbucket Repository not found."}
+
+    @responses.activate
+    def test_search_issues_rate_limited(self) -> None:
+        responses.add(
+            responses.GET,
+            "https://api.bitbucket.org/2.0/repositories/meredithanya/apples/issues",
+            json={"type": "error", "error": {"message": "Rate limit exceeded"}},
+            status=429,
+        )
+        resp = self.client.get(
+            self.path,
+            data={"field": "externalIssue", "query": "issue", "repo": "meredithanya/apples"},
+        )
+        assert resp.status_code == 429
+        assert resp.data == {"detail": "Bitbucket rate limit exceeded."}
+
+
+def test_get_error_message() -> None:
+    assert (
+        _get_error_message(ApiError('{"error": {"message": "Resource not found"}}'))
+        == "Resource not found"
+    )
+    assert _get_error_message(ApiError('{"error": "Resource not found"}')) is None
+    assert _get_error_message(ApiError('["Resource not found"]')) is None
+    assert _get_error_message(ApiError("Resource not found")) is None
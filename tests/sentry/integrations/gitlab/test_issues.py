@@ -194,6 +194,36 @@ class GitlabIssuesTest(GitLabTestCase):
             "metadata": {"display_name": key},
         }
 
+    @responses.activate
+    def test_create_issue_uses_full_reference(self) -> None:
+        project_id = "10"
+        project_name = "getsentry/sentry"
+        key = f"{project_name}#1"
+        responses.add(
+            responses.POST,
+            "https://example.gitlab.com/api/v4/projects/%s/issues" % project_id,
+            json={
+                "id": 8,
+                "iid": "1",
+                "title": "hello",
+                "description": "This is the description",
+                "web_url": f"https://example.gitlab.com/{project_name}/issues/1",
+                "references": {"short": "#1", "relative": "#1", "full": key},
+            },
+        )
+        form_data = {
+            "project": project_id,
+            "title": "hello",
+            "description": "This is the description",
+        }
+
+        result = self.installation.create_issue(form_data)
+
+        assert result["key"] == key
+        assert result["metadata"] == {"display_name": key}
+        # The project is never fetched when the issue carries its full reference.
+        assert len(responses.calls) == 1
+
     @responses.activate
     def test_get_issue(self) -> None:
         project_id = "12"
@@ -226,6 +256,32 @@ class GitlabIssuesTest(GitLabTestCase):
             "metadata": {"display_name": key},
         }
 
+    @responses.activate
+    def test_get_issue_without_full_reference_fetches_current_project_path(self) -> None:
+        project_id = "12"
+        responses.add(
+            responses.GET,
+            f"https://example.gitlab.com/api/v4/projects/{project_id}/issues/13",
+            json={
+                "id": 18,
+                "iid": "13",
+                "title": "hello",
+                "description": "This is the description",
+                "web_url": "https://example.gitlab.com/getsentry/sentry/issues/13",
+            },
+        )
+        for project_name in ("getsentry/sentry", "getsentry/renamed"):
+            responses.add(
+                responses.GET,
+                "https://example.gitlab.com/api/v4/projects/%s" % project_id,
+                json={"id": project_id, "path_with_namespace": project_name},
+            )
+
+        result = self.installation.get_issue(issue_id=f"{project_id}#13", data={})
+        assert result["key"] == "getsentry/sentry#13"
+        result = self.installation.get_issue(issue_id=f"{project_id}#13", data={})
+        assert result["key"] == "getsentry/renamed#13"
+
     @responses.activate
     def test_create_issue_default_project_in_group_api_call(self) -> None:
         group_description = (
@@ -5,6 +5,7 @@ from urllib.parse import urlencode
 
 import pytest
 import responses
+from django.core.cache import cache
 from django.test import override_settings
 from requests import Request
 
@@ -86,6 +87,28 @@ class MsTeamsClientTest(TestCase):
                 "service_url": "https://smba.trafficmanager.net/amer/",
             }
 
+    @responses.activate
+    def test_token_refresh_shared_between_clients(self) -> None:
+        other_client = MsTeamsClient(self.integration)
+        with patch("time.time") as mock_time:
+            mock_time.return_value = self.expires_at
+            assert self.msteams_client.access_token == "my_new_token"
+            assert other_client.access_token == "my_new_token"
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_token_refresh_uses_cached_token(self) -> None:
+        cache.set(
+            f"msteams:token:{self.integration.id}",
+            {"access_token": "cached_token", "expires_at": self.expires_at + 3600},
+        )
+        with patch("time.time") as mock_time:
+            mock_time.return_value = self.expires_at
+            assert self.msteams_client.access_token == "cached_token"
+
+        assert not responses.calls
+
     @responses.activate
     def test_token_refreshes_with_integration_not_found(self) -> None:
         self.integration.delete()
@@ -1,11 +1,14 @@
 import datetime
+import threading
 from datetime import timezone
 from functools import cached_property
 from time import time
+from unittest.mock import patch
 
 import responses
 
 from fixtures.vsts import COMMIT_DETAILS_EXAMPLE, COMPARE_COMMITS_EXAMPLE, FILE_CHANGES_EXAMPLE
+from sentry.identity.vsts.provider import VSTSIdentityProvider
 from sentry.integrations.vsts.repository import VstsRepositoryProvider
 from sentry.models.repository import Repository
 from sentry.silo.base import SiloMode
@@ -84,6 +87,63 @@ class VisualStudioRepositoryProviderTest(TestCase):
             }
         ]
 
+    @responses.activate
+    def test_zip_commit_data_refreshes_expired_identity_before_fan_out(self) -> None:
+        shas = ["a" * 40, "b" * 40, "c" * 40]
+        for sha in shas:
+            responses.add(
+                responses.GET,
+                f"https://visualstudio.com/_apis/git/repositories/123/commits/{sha}/changes",
+                body=FILE_CHANGES_EXAMPLE,
+            )
+
+        integration = self.create_provider_integration(
+            provider="vsts",
+            external_id=self.vsts_external_id,
+            name="Hello world",
+            metadata={"domain_name": self.base_url},
+        )
+        default_auth = Identity.objects.create(
+            idp=self.create_identity_provider(type="vsts"),
+            user=self.user,
+            external_id="123",
+            data={
+                "access_token": "expired",
+                "expires": int(time()) - 60,
+                "refresh_token": "rxxx-xxxx",
+                "token_type": "jwt-bearer",
+            },
+        )
+        integration.add_organization(self.organization, self.user, default_auth.id)
+        with assume_test_silo_mode(SiloMode.CELL):
+            repo = Repository.objects.create(
+                provider="visualstudio",
+                name="example",
+                organization_id=self.organization.id,
+                external_id="123",
+                config={"instance": self.base_url, "project": "project-name", "name": "example"},
+                integration_id=integration.id,
+            )
+
+        refresh_threads = []
+
+        def refresh_identity(provider, identity, **kwargs):
+            refresh_threads.append(threading.current_thread())
+            identity.data.update({"access_token": "refreshed", "expires": int(time()) + 3600})
+
+        with patch.object(
+            VSTSIdentityProvider, "refresh_identity", autospec=True, side_effect=refresh_identity
+        ):
+            commits = self.provider.zip_commit_data(
+                repo, [{"commitId": sha} for sha in shas], self.organization.id
+            )
+
+        assert refresh_threads == [threading.current_thread()]
+        assert [c["patch_set"] for c in commits] == [[{"path": "/README.md", "type": "M"}]] * 3
+        assert all(
+            call.request.headers["Authorization"] == "Bearer refreshed" for call in responses.calls
+        )
+
     @responses.activate
     def test_build_repository_config(self) -> None:
         organization = self.create_organization()
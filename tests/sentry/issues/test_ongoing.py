@@ -1,7 +1,10 @@
+from unittest.mock import patch
+
 from sentry.issues.ongoing import bulk_transition_group_to_ongoing
 from sentry.models.activity import Activity
 from sentry.models.group import GroupStatus
 from sentry.models.grouphistory import GroupHistory, GroupHistoryStatus
+from sentry.models.groupinbox import GroupInbox, GroupInboxReason, add_group_to_inbox
 from sentry.testutils.cases import TestCase
 from sentry.types.activity import ActivityType
 from sentry.types.group import GroupSubStatus, PriorityLevel
@@ -60,3 +63,22 @@ class TransitionNewToOngoingTest(TestCase):
             group=group, status=GroupHistoryStatus.PRIORITY_MEDIUM
         ).exists()
         assert Activity.objects.filter(group=group, type=ActivityType.SET_PRIORITY.value).exists()
+
+    def test_removes_groups_from_inbox(self) -> None:
+        group = self.create_group(status=GroupStatus.UNRESOLVED, substatus=GroupSubStatus.NEW)
+        add_group_to_inbox(group, GroupInboxReason.NEW)
+
+        bulk_transition_group_to_ongoing(GroupStatus.UNRESOLVED, GroupSubStatus.NEW, [group.id])
+
+        assert not GroupInbox.objects.filter(group=group).exists()
+
+    def test_no_matching_groups(self) -> None:
+        group = self.create_group(status=GroupStatus.UNRESOLVED, substatus=GroupSubStatus.ONGOING)
+
+        with patch("sentry.issues.ongoing.post_save.send_robust") as send_robust:
+            bulk_transition_group_to_ongoing(GroupStatus.UNRESOLVED, GroupSubStatus.NEW, [group.id])
+
+        assert not send_robust.called
+        assert not Activity.objects.filter(
+            group=group, type=ActivityType.AUTO_SET_ONGOING.value
+        ).exists()
@@ -109,3 +109,10 @@ class ExternalIssueManagerTest(TestCase):
             event=group_event, integration=self.api_integration1
         )
         assert result
+
+    def test_get_linked_integration_ids(self) -> None:
+        result = ExternalIssue.objects.get_linked_integration_ids(event=self.group_event1)
+        assert result == {self.integration1.id, self.integration2.id}
+
+        result = ExternalIssue.objects.get_linked_integration_ids(event=self.group_event2)
+        assert result == {self.integration1.id}
@@ -5,6 +5,7 @@ from pytest import raises
 from requests import PreparedRequest, Request
 
 from sentry.exceptions import RestrictedIPAddress
+from sentry.http import build_session
 from sentry.net.http import Session
 from sentry.shared_integrations.client.base import BaseApiClient
 from sentry.shared_integrations.exceptions import ApiHostError
@@ -73,6 +74,26 @@ class BaseApiClientTest(TestCase):
             self.api_client.get("https://172.31.255.255")
         assert mock_finalize_request.called
 
+    @responses.activate
+    def test_reuse_session(self) -> None:
+        responses.add(responses.GET, "https://example.com/get", json={})
+
+        class ReusingClient(BaseApiClient):
+            integration_type = "integration"
+            integration_name = "reusing"
+            reuse_session = True
+
+        with patch(
+            "sentry.shared_integrations.client.base.build_session", wraps=build_session
+        ) as mock_build_session:
+            ReusingClient().get("https://example.com/get")
+            ReusingClient().get("https://example.com/get")
+            assert mock_build_session.call_count == 1
+
+            self.api_client.get("https://example.com/get")
+            self.api_client.get("https://example.com/get")
+            assert mock_build_session.call_count == 3
+
     @patch.object(Session, "send")
     def test_default_timeout(self, mock_session_send) -> None:
         response = MagicMock()